@@ -1,61 +1,87 @@
-from collections import deque
-from typing import Optional, Deque
+import heapq
+from typing import List, Optional, Tuple
 
 class EventListManager:
     """
-    Manages the future event list for the simulation, ensuring events are processed
-    in chronological order. This class follows the singleton pattern so that
-    the entire simulation shares the same event list.
-    """
+    Manages the future event list for a simulation, ensuring events are processed
+    in chronological order. Each NetworkSimulation owns its own instance, so
+    several simulations (e.g. independent replications) can run in the same
+    process without sharing state.
 
-    _instance: Optional['EventListManager'] = None
+    The event list is a calendar queue: time is divided into fixed-width buckets
+    (width 1/bucket_rate seconds, one "year" = n_buckets buckets) and events are
+    appended to the bucket covering their timestamp, which is O(1). Only the
+    bucket currently being drained is kept in a small binary heap, so polling
+    stays cheap while insertion avoids heap bookkeeping for future events.
+    Events more than a year ahead wrap around and are left in place until the
+    calendar advances into their year. A monotonic sequence number breaks ties
+    between events with equal timestamps, preserving FIFO insertion order.
+    """
 
-    def __init__(self) -> None:
-        if EventListManager._instance is not None:
-            raise Exception("Use EventListManager.get_instance() to get the singleton instance.")
-        self.event_list: Deque['Event'] = deque()
+    __slots__ = ("_rate", "_n_buckets", "_buckets", "_tree", "_cur_bucket", "_size", "_seq")
 
-    @classmethod
-    def get_instance(cls) -> 'EventListManager':
+    def __init__(self, bucket_rate: float = 1250000.0, n_buckets: int = 64) -> None:
         """
-        Return the singleton instance of EventListManager.
+        :param bucket_rate: Buckets per second of simulated time. The default
+                            matches the service rate MU, so bucket width is
+                            roughly one mean service time.
+        :param n_buckets: Number of buckets in the calendar; sized so the
+                          current-bucket heap stays small (~10-20 events).
         """
-        if cls._instance is None:
-            cls._instance = EventListManager()
-        return cls._instance
+        self._rate: float = bucket_rate
+        self._n_buckets: int = n_buckets
+        self._buckets: List[List[Tuple[float, int, 'Event']]] = [[] for _ in range(n_buckets)]
+        self._tree: List[Tuple[float, int, 'Event']] = []  # Heap over the current bucket
+        self._cur_bucket: int = 0  # Absolute (non-wrapped) index of the current bucket
+        self._size: int = 0
+        self._seq: int = 0
 
     def insert_event(self, event: 'Event') -> None:
         """
-        Insert an event into the event list in chronological order.
+        Insert an event into the event list, keyed on its event time.
         """
-        if self.is_empty():
-            self.event_list.append(event)
-            return
-
-        inserted = False
-        for i, existing_event in enumerate(self.event_list):
-            if event.get_event_clock() <= existing_event.get_event_clock():
-                self.event_list.insert(i, event)
-                inserted = True
-                break
-
-        if not inserted:
-            self.event_list.append(event)
+        self._seq += 1
+        event_time = event.get_event_clock()
+        entry = (event_time, self._seq, event)
+        bucket = int(event_time * self._rate)
+        if bucket <= self._cur_bucket:
+            # Due in (or before) the bucket being drained - goes straight to the heap.
+            heapq.heappush(self._tree, entry)
+        else:
+            self._buckets[bucket % self._n_buckets].append(entry)
+        self._size += 1
 
     def poll(self) -> Optional['Event']:
         """
         Pop and return the earliest event from the list.
         Returns None if the list is empty.
         """
-        if self.event_list:
-            return self.event_list.popleft()
-        return None
+        if self._size == 0:
+            return None
+
+        # Advance the calendar until the current bucket's heap holds an event,
+        # moving due entries out of each visited bucket and leaving entries
+        # that belong to a later year in place.
+        while not self._tree:
+            self._cur_bucket += 1
+            slot = self._buckets[self._cur_bucket % self._n_buckets]
+            if slot:
+                pending: List[Tuple[float, int, 'Event']] = []
+                for entry in slot:
+                    if int(entry[0] * self._rate) <= self._cur_bucket:
+                        heapq.heappush(self._tree, entry)
+                    else:
+                        pending.append(entry)
+                self._buckets[self._cur_bucket % self._n_buckets] = pending
+
+        self._size -= 1
+        return heapq.heappop(self._tree)[2]
 
     def is_empty(self) -> bool:
         """
         Check if the event list is empty.
         """
-        return len(self.event_list) == 0
+        return self._size == 0
 
     def print_future_events(self) -> None:
         """
@@ -66,6 +92,10 @@ class EventListManager:
             print("No future events scheduled.")
             return
 
+        entries = list(self._tree)
+        for slot in self._buckets:
+            entries.extend(slot)
+
         print("Future Events in the System:")
-        for evt in self.event_list:
+        for _, _, evt in sorted(entries):
             print(evt)
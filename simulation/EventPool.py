@@ -0,0 +1,35 @@
+from typing import List
+from simulation.Event import Event
+
+class EventPool:
+    """
+    Free-list pool of Event instances. Events are created by the millions in a
+    long run but live only from scheduling to polling, so recycling them
+    through a pool removes almost all of the per-packet allocation work.
+    """
+
+    __slots__ = ("_free",)
+
+    def __init__(self) -> None:
+        self._free: List['Event'] = []
+
+    def acquire(self, event_time, event_type, destination, origin, source_num=None) -> 'Event':
+        """
+        Return an Event with the given fields, reusing a released instance
+        when one is available.
+        """
+        if self._free:
+            event = self._free.pop()
+            event.event_time = event_time
+            event.type = event_type
+            event.destination = destination
+            event.origin = origin
+            event.source_num = source_num
+            return event
+        return Event(event_time, event_type, destination, origin, source_num)
+
+    def release(self, event: 'Event') -> None:
+        """
+        Return an Event to the pool. The caller must not keep using it.
+        """
+        self._free.append(event)
@@ -2,17 +2,61 @@ import numpy as np
 
 class ExpRandGenerator:
     """
-    Generates exponentially distributed random values based on a given rate parameter λ.
+    Generates exponentially distributed random values for a fixed rate parameter λ.
+
+    Draws are produced in batches: a buffer of standard-exponential values is
+    filled in a single vectorized Ziggurat call, scaled by 1/λ in one vectorized
+    multiply, and handed out one at a time - so the per-draw cost is an index
+    into the buffer with no division or NumPy call.
     """
 
-    def gen_random(self, lamda):
+    __slots__ = ("_inv_rate", "_rng", "_buf", "_idx")
+
+    _BATCH = 4096
+
+    def __init__(self, rate, seed=None) -> None:
+        """
+        :param rate: The rate parameter (λ). Must be positive.
+        :param seed: Optional seed for this generator's private PCG64 stream.
+                     Each generator owns its own stream, so seeded components
+                     are reproducible and independent of one another.
+        """
+        if rate <= 0:
+            raise ValueError("Rate parameter λ must be positive.")
+        self._inv_rate = 1.0 / rate
+        self._rng = np.random.default_rng(seed)
+        self._buf = np.empty(0)
+        self._idx = 0
+
+    def fill(self) -> None:
+        """
+        Refill the buffer with a fresh batch of Exp(λ) values.
         """
-        Generate a random value from an exponential distribution with the given rate λ.
+        # Exp(λ) is a standard exponential scaled by 1/λ; scale the whole
+        # batch in place rather than dividing on every draw.
+        self._buf = self._rng.standard_exponential(self._BATCH, method='zig')
+        np.multiply(self._buf, self._inv_rate, out=self._buf)
+        self._idx = 0
+
+    def gen_batch(self, n):
+        """
+        Generate n Exp(λ) values in one vectorized call.
+
+        :param n: Number of values to generate.
+        :return: A NumPy array of n exponentially distributed values (seconds).
+        """
+        batch = self._rng.standard_exponential(n, method='zig')
+        np.multiply(batch, self._inv_rate, out=batch)
+        return batch
+
+    def gen_random(self):
+        """
+        Generate a random value from an exponential distribution with rate λ.
 
-        :param lamda: The rate parameter (λ). Must be positive.
         :return: A random exponentially distributed value (float) in seconds.
         """
-        if lamda <= 0:
-            raise ValueError("Rate parameter λ must be positive.")
-        scale = 1.0 / lamda
-        return np.random.exponential(scale)
+        if self._idx >= len(self._buf):
+            self.fill()
+        value = self._buf[self._idx]
+        self._idx += 1
+        return value
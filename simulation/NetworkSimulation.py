@@ -1,6 +1,8 @@
 from typing import List, Tuple
+import numpy as np
 from simulation.EventListManager import EventListManager
 from simulation.Event import Event
+from simulation.EventPool import EventPool
 from simulation.Queue import Queue
 from simulation.Source import Source
 
@@ -11,18 +13,43 @@ class NetworkSimulation:
     Processes events in chronological order until the desired number of arrivals is met.
     """
 
-    def __init__(self, max_arrivals: int = 10000) -> None:
+    def __init__(self, max_arrivals: int = 10000, logging_enabled: bool = False, seed=None) -> None:
         """
         Initialize the NetworkSimulation.
+
+        :param max_arrivals: Number of source arrivals to simulate.
+        :param logging_enabled: When True, every polled and scheduled event is
+                                formatted and recorded in processed_events.
+                                Off by default - formatting and storing millions
+                                of entries dominates the run time.
+        :param seed: Optional master seed. Spawned into an independent child
+                     stream per source and queue, so a seeded run is exactly
+                     reproducible and replications with different seeds are
+                     statistically independent.
         """
         self.global_time: float = 0.0
         self.packets_arrived: int = 0
         self.max_arrivals: int = max_arrivals
-        self.e_list: 'EventListManager' = EventListManager.get_instance()
+        self.logging_enabled: bool = logging_enabled
+        self.e_list: 'EventListManager' = EventListManager()
+
+        # Recycles Event instances between scheduling and polling
+        self._pool: 'EventPool' = EventPool()
+
+        # Per-source precomputed arrival times and a cursor into each stream
+        # (filled in by gen_init_packets)
+        self._arrival_times: List[List[float]] = []
+        self._arrival_idx: List[int] = []
 
-        # Keep track of all events processed for logging
+        # Keep track of all events processed for logging (when enabled)
         # Each entry: (time, action, event_string)
-        self.processed_events: List[Tuple[float, str, str]] = []
+        # Presized to the expected entry count (a handful per arrival) and
+        # filled by indexed store, avoiding append-driven list regrowth;
+        # trimmed back to the used length when the run finishes.
+        self.processed_events: List[Tuple[float, str, str]] = (
+            [None] * (self.max_arrivals * 4) if logging_enabled else []
+        )
+        self._pe_idx: int = 0
 
         # Define source parameters as (erlangs, destination)
         # 4 sources going into different points in the network
@@ -32,7 +59,6 @@ class NetworkSimulation:
             (0.4, Queue.ONE_B),  # Source 2 -> Q1
             (0.2, Queue.TWO_A),  # Source 3 -> Q2
         ]
-        self.sources: List['Source'] = [Source(erlangs, dest) for erlangs, dest in source_params]
 
         # Topology definition for queues
         queue_params = {
@@ -50,24 +76,55 @@ class NetworkSimulation:
             Queue.FOUR_A: ([], "Router Q7", 10),
         }
 
+        # One independent child seed per source and queue
+        seeds = np.random.SeedSequence(seed).spawn(len(source_params) + len(queue_params))
+        self.sources: List['Source'] = [
+            Source(erlangs, dest, seeds[i]) for i, (erlangs, dest) in enumerate(source_params)
+        ]
+
         max_queue_index = max(queue_params.keys())
         self.queues: List['Queue'] = [None] * (max_queue_index + 1)
-        for q_const, (next_queues, q_name, q_cap) in queue_params.items():
-            self.queues[q_const] = Queue(next_queues, q_name, q_cap)
+        for i, (q_const, (next_queues, q_name, q_cap)) in enumerate(queue_params.items()):
+            self.queues[q_const] = Queue(next_queues, q_name, q_cap, seeds[len(source_params) + i])
 
     def gen_init_packets(self) -> None:
         """
-        Generate initial arrival events from each source at the start of the simulation.
+        Precompute every source's arrival stream and schedule the first
+        arrival from each. Source arrivals are a Poisson process independent
+        of the simulation state, so each stream is generated in one vectorized
+        pass up front; the event loop then feeds arrivals in one-ahead per
+        source from the arrays instead of drawing from the RNG per packet.
+        Each stream holds max_arrivals times so it cannot run dry before the
+        arrival cap is reached, whatever the traffic mix.
         """
         for i, source in enumerate(self.sources):
-            arrival_event: 'Event' = source.gen_arrival(self.global_time, i)
-            self.e_list.insert_event(arrival_event)
+            origin: str = "Source {}".format(i)
+            times = source.precompute_arrivals(self.max_arrivals, self.global_time).tolist()
+            self._arrival_times.append(times)
+            self._arrival_idx.append(1)
+            self.e_list.insert_event(
+                self._pool.acquire(times[0], Event.ARRIVAL, source.destination, origin, i)
+            )
             self.packets_arrived += 1
 
+    def _log(self, entry: Tuple[float, str, str]) -> None:
+        """
+        Record a processed-event entry in the presized log, growing it only
+        if the run produces more entries than estimated.
+        """
+        if self._pe_idx < len(self.processed_events):
+            self.processed_events[self._pe_idx] = entry
+        else:
+            self.processed_events.append(entry)
+        self._pe_idx += 1
+
     def print_all_processed_events(self) -> None:
         """
         Print all processed events (including arrivals, departures, and drops).
+        Does nothing unless the simulation was created with logging_enabled.
         """
+        if not self.logging_enabled:
+            return
         print("All Processed Events (including arrivals, departures, and drops):")
         for event_time, action, evt_str in self.processed_events:
             print("[Time={:.5f}] {}: {}".format(event_time, action, evt_str))
@@ -78,49 +135,79 @@ class NetworkSimulation:
         """
         self.gen_init_packets()
 
+        # Hoist hot-loop lookups to locals: method binds and constants are
+        # resolved once instead of on every event.
+        poll = self.e_list.poll
+        insert_event = self.e_list.insert_event
+        acquire_event = self._pool.acquire
+        release_event = self._pool.release
+        queues = self.queues
+        arrival_times = self._arrival_times
+        arrival_idx = self._arrival_idx
+        ARRIVAL = Event.ARRIVAL
+        DEPARTURE = Event.DEPARTURE
+        logging_enabled = self.logging_enabled
+
         while self.packets_arrived < self.max_arrivals:
-            event: 'Event' = self.e_list.poll()
+            event: 'Event' = poll()
             if event is None:
                 break
 
             # Log the event as processed / departed
-            self.processed_events.append((self.global_time, "POLLED", str(event)))
+            if logging_enabled:
+                self._log((self.global_time, "POLLED", str(event)))
 
             self.global_time = event.get_event_clock()
+            queue: 'Queue' = queues[event.destination]
 
-            if event.type == Event.ARRIVAL:
-                return_time: float = self.queues[event.destination].add_packet(event, self.global_time)
+            if event.type == ARRIVAL:
+                return_time: float = queue.add_packet(event, self.global_time)
                 if return_time > -1:
                     departure_time: float = self.global_time + return_time
-                    origin: str = self.queues[event.destination].name
-                    dep_event: 'Event' = Event(departure_time, Event.DEPARTURE, event.destination, origin)
-                    self.e_list.insert_event(dep_event)
-                    self.processed_events.append((self.global_time, "SCHEDULED", str(dep_event)))
-
-                # If it's an arrival from a source, schedule next arrival
-                if "Source" in event.origin:
-                    source_num: int = int(event.origin.split()[1])
-                    new_arrival: 'Event' = self.sources[source_num].gen_arrival(self.global_time, source_num)
-                    self.e_list.insert_event(new_arrival)
-                    self.packets_arrived += 1
-                    self.processed_events.append((self.global_time, "SCHEDULED", str(new_arrival)))
-
-            elif event.type == Event.DEPARTURE:
-                return_time: float = self.queues[event.destination].remove_packet(self.global_time)
+                    dep_event: 'Event' = acquire_event(departure_time, DEPARTURE, event.destination, queue.name)
+                    insert_event(dep_event)
+                    if logging_enabled:
+                        self._log((self.global_time, "SCHEDULED", str(dep_event)))
+
+                # If it's an arrival from a source, schedule the next arrival
+                # from the source's precomputed stream
+                if event.source_num is not None:
+                    source_num: int = event.source_num
+                    idx: int = arrival_idx[source_num]
+                    if idx < self.max_arrivals:
+                        arrival_idx[source_num] = idx + 1
+                        new_arrival: 'Event' = acquire_event(
+                            arrival_times[source_num][idx], ARRIVAL,
+                            event.destination, event.origin, source_num
+                        )
+                        insert_event(new_arrival)
+                        self.packets_arrived += 1
+                        if logging_enabled:
+                            self._log((self.global_time, "SCHEDULED", str(new_arrival)))
+
+            elif event.type == DEPARTURE:
+                return_time: float = queue.remove_packet(self.global_time)
                 if return_time > -1:
                     departure_time: float = self.global_time + return_time
-                    origin: str = self.queues[event.destination].name
-                    dep_event: 'Event' = Event(departure_time, Event.DEPARTURE, event.destination, origin)
-                    self.e_list.insert_event(dep_event)
-                    self.processed_events.append((self.global_time, "SCHEDULED", str(dep_event)))
+                    dep_event: 'Event' = acquire_event(departure_time, DEPARTURE, event.destination, queue.name)
+                    insert_event(dep_event)
+                    if logging_enabled:
+                        self._log((self.global_time, "SCHEDULED", str(dep_event)))
 
                 # Schedule arrivals for next queues if any
-                for nq in self.queues[event.destination].next_queues:
-                    if nq != Queue.NO_DESTINATION:
-                        origin: str = self.queues[event.destination].name
-                        arr_event: 'Event' = Event(self.global_time, Event.ARRIVAL, nq, origin)
-                        self.e_list.insert_event(arr_event)
-                        self.processed_events.append((self.global_time, "SCHEDULED", str(arr_event)))
+                for nq in queue.next_queues:
+                    arr_event: 'Event' = acquire_event(self.global_time, ARRIVAL, nq, queue.name)
+                    insert_event(arr_event)
+                    if logging_enabled:
+                        self._log((self.global_time, "SCHEDULED", str(arr_event)))
+
+            # The polled event is fully processed and nothing retains it -
+            # hand it back to the pool for reuse.
+            release_event(event)
+
+        # Trim the presized log down to the entries actually written
+        if logging_enabled:
+            del self.processed_events[self._pe_idx:]
 
         # Print final queue stats
         for q in self.queues:
@@ -1,5 +1,5 @@
 from collections import deque
-from typing import Deque, List
+from typing import Deque, List, Tuple
 from simulation.ExpRandomGenerator import ExpRandGenerator
 
 class Queue:
@@ -9,6 +9,20 @@ class Queue:
     a service discipline and capacity limits.
     """
 
+    # Fixed attribute layout: instances are accessed heavily in the event
+    # loop, and slots replace the per-instance __dict__ probe with an
+    # index into a fixed descriptor table.
+    __slots__ = (
+        "next_queues", "name", "size_limit",
+        "total_waiting_time", "total_transmission_time", "total_batch_time",
+        "_waiting_c", "_transmission_c", "_batch_c",
+        "total_time", "packets_offered", "packets_dropped",
+        "packets_dropped_per_batch", "packets_transmitted",
+        "_offered_countdown", "_transmitted_countdown",
+        "_arr_times", "_head", "_tail", "_count",
+        "batch_means", "loss_ratios", "expR", "is_busy",
+    )
+
     # Queue identifiers
     ONE_A = 0
     ONE_B = 1
@@ -22,35 +36,54 @@ class Queue:
 
     MU = 1250000  # Transmission / Service rate - 10Gbps
 
-    def __init__(self, next_queues: List[int], name: str, size_limit: int) -> None:
+    def __init__(self, next_queues: List[int], name: str, size_limit: int, seed=None) -> None:
         """
         Initialize the queue with its next destination, name, and size limit.
 
         :param next_queues: The next queue IDs to which packets may be forwarded.
         :param name: Name of the queue, for identification.
         :param size_limit: Maximum number of packets the queue can hold.
+        :param seed: Optional seed for this queue's service-time random stream.
         """
-        self.next_queues: List[int] = next_queues
+        # Stored as a flat tuple: it is iterated on every departure and
+        # never mutated after construction.
+        self.next_queues: Tuple[int, ...] = tuple(next_queues)
         self.name: str = name
         self.size_limit: int = size_limit
 
-        # Statistics and counters
+        # Statistics and counters. The time accumulators sum millions of tiny
+        # values, so each carries a Kahan compensation term (_c) that captures
+        # the low-order bits lost by plain floating-point addition.
         self.total_waiting_time: float = 0.0
         self.total_transmission_time: float = 0.0
         self.total_batch_time: float = 0.0
+        self._waiting_c: float = 0.0
+        self._transmission_c: float = 0.0
+        self._batch_c: float = 0.0
         self.total_time: float = 0.0
         self.packets_offered: int = 0
         self.packets_dropped: int = 0
         self.packets_dropped_per_batch: int = 0
         self.packets_transmitted: int = 0
 
-        # Data structures
-        self.packets: Deque[tuple['Event', float]] = deque()  # Stores (event, arrival_time)
+        # Countdowns to the next 5000-packet batch boundary; a decrement and
+        # zero test per packet is cheaper than a modulo on the counters.
+        self._offered_countdown: int = 5000
+        self._transmitted_countdown: int = 5000
+
+        # Waiting packets are represented purely by their arrival times in a
+        # fixed-capacity ring buffer - nothing else about a queued packet is
+        # ever read, so no per-packet tuple or Event reference is kept.
+        self._arr_times: List[float] = [0.0] * size_limit
+        self._head: int = 0
+        self._tail: int = 0
+        self._count: int = 0
+
         self.batch_means: Deque[float] = deque()
         self.loss_ratios: Deque[float] = deque()
 
         # Random generator for exponential service times
-        self.expR: 'ExpRandGenerator' = ExpRandGenerator()
+        self.expR: 'ExpRandGenerator' = ExpRandGenerator(self.MU, seed)
 
         # Indicates if the server (queue) is busy
         self.is_busy: bool = False
@@ -67,11 +100,13 @@ class Queue:
         self.packets_offered += 1
 
         # Calculate loss ratio every 5000 offered packets
-        if self.packets_offered % 5000 == 0:
+        self._offered_countdown -= 1
+        if self._offered_countdown == 0:
             self.calc_loss_ratio()
+            self._offered_countdown = 5000
 
         # If the queue is full, drop the packet
-        if len(self.packets) == self.size_limit:
+        if self._count == self.size_limit:
             self.packets_dropped += 1
             self.packets_dropped_per_batch += 1
             return -1.0
@@ -79,13 +114,22 @@ class Queue:
         # If not busy, start transmitting immediately
         if not self.is_busy:
             self.is_busy = True
-            transmission_time = self.expR.gen_random(self.MU)
-            self.total_transmission_time += transmission_time
-            self.total_batch_time += transmission_time
+            transmission_time = self.expR.gen_random()
+            # Kahan compensated accumulation
+            y = transmission_time - self._transmission_c
+            t = self.total_transmission_time + y
+            self._transmission_c = (t - self.total_transmission_time) - y
+            self.total_transmission_time = t
+            y = transmission_time - self._batch_c
+            t = self.total_batch_time + y
+            self._batch_c = (t - self.total_batch_time) - y
+            self.total_batch_time = t
             return transmission_time
 
-        # Otherwise, enqueue the packet
-        self.packets.append((event, event.get_event_clock()))
+        # Otherwise, enqueue the packet's arrival time
+        self._arr_times[self._tail] = event.get_event_clock()
+        self._tail = (self._tail + 1) % self.size_limit
+        self._count += 1
         return -1.0
 
     def remove_packet(self, current_time: float) -> float:
@@ -98,25 +142,40 @@ class Queue:
         self.packets_transmitted += 1
 
         # Calculate batch times every 5000 transmitted packets
-        if self.packets_transmitted % 5000 == 0:
+        self._transmitted_countdown -= 1
+        if self._transmitted_countdown == 0:
             self.calc_batch_times()
+            self._transmitted_countdown = 5000
 
         # If no packets are waiting, the server becomes idle
-        if not self.packets:
+        if self._count == 0:
             self.is_busy = False
             return -1.0
 
         # Process the next packet in the queue
-        event, arrival_time = self.packets.popleft()
+        arrival_time = self._arr_times[self._head]
+        self._head = (self._head + 1) % self.size_limit
+        self._count -= 1
         waiting_time = current_time - arrival_time
-        if waiting_time < 0:
-            # Should not occur if events are processed in order.
-            waiting_time = 0.0
-
-        self.total_waiting_time += waiting_time
-        transmission_time = self.expR.gen_random(self.MU)
-        self.total_transmission_time += transmission_time
-        self.total_batch_time += (waiting_time + transmission_time)
+        # The event list guarantees chronological processing, so a negative
+        # wait would mean event ordering is broken (checked in debug runs
+        # only; stripped under python -O).
+        assert waiting_time >= 0, "event ordering violated"
+
+        transmission_time = self.expR.gen_random()
+        # Kahan compensated accumulation
+        y = waiting_time - self._waiting_c
+        t = self.total_waiting_time + y
+        self._waiting_c = (t - self.total_waiting_time) - y
+        self.total_waiting_time = t
+        y = transmission_time - self._transmission_c
+        t = self.total_transmission_time + y
+        self._transmission_c = (t - self.total_transmission_time) - y
+        self.total_transmission_time = t
+        y = (waiting_time + transmission_time) - self._batch_c
+        t = self.total_batch_time + y
+        self._batch_c = (t - self.total_batch_time) - y
+        self.total_batch_time = t
         return transmission_time
 
     def calc_batch_times(self) -> None:
@@ -126,6 +185,7 @@ class Queue:
         if self.packets_transmitted > 0:
             self.batch_means.append(self.total_batch_time / 5000)
             self.total_batch_time = 0.0
+            self._batch_c = 0.0
 
     def calc_loss_ratio(self) -> None:
         """
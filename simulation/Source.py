@@ -1,3 +1,4 @@
+import numpy as np
 from simulation.ExpRandomGenerator import ExpRandGenerator
 from simulation.Event import Event
 
@@ -6,17 +7,20 @@ class Source:
     Represents a traffic source that generates arrival events at a given rate (in Erlangs).
     """
 
-    def __init__(self, erlangs: float, destination: int) -> None:
+    __slots__ = ("erlangs", "destination", "lamda", "expR")
+
+    def __init__(self, erlangs: float, destination: int, seed=None) -> None:
         """
         Initialize the Source.
 
         :param erlangs: Offered load in Erlangs.
         :param destination: The queue ID where arrivals from this source are directed.
+        :param seed: Optional seed for this source's random stream.
         """
         self.erlangs: float = erlangs
         self.destination: int = destination
         self.lamda: float = 1250000 * self.erlangs
-        self.expR: 'ExpRandGenerator' = ExpRandGenerator()
+        self.expR: 'ExpRandGenerator' = ExpRandGenerator(self.lamda, seed)
 
     def gen_arrival(self, current_time: float, source_num: int) -> 'Event':
         """
@@ -26,7 +30,19 @@ class Source:
         :param source_num: The identifier of this source.
         :return: An ARRIVAL event scheduled for a future time.
         """
-        inter_arrival: float = self.expR.gen_random(self.lamda)
+        inter_arrival: float = self.expR.gen_random()
         arrival_time: float = current_time + inter_arrival
         origin: str = "Source {}".format(source_num)
-        return Event(arrival_time, Event.ARRIVAL, self.destination, origin)
+        return Event(arrival_time, Event.ARRIVAL, self.destination, origin, source_num)
+
+    def precompute_arrivals(self, n: int, start_time: float = 0.0):
+        """
+        Generate the absolute arrival times of this source's next n packets in
+        one vectorized pass. A Poisson arrival process does not depend on the
+        simulation state, so the whole stream can be computed ahead of time.
+
+        :param n: Number of arrivals to generate.
+        :param start_time: Simulation time the stream starts from (in seconds).
+        :return: A NumPy array of n increasing arrival times (in seconds).
+        """
+        return start_time + np.cumsum(self.expR.gen_batch(n))